@@ -1,6 +1,31 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import re
+import sys
+import contextlib
+
+# Line prefixes tested by apply_indent; str.startswith checks a tuple in C without regex overhead
+_DEDENT_KW = ("elif", "else", "except", "finally")
+_DEFCLASS_KW = ("def ", "class ")
+_BLOCK_KW = _DEFCLASS_KW + ("if ", "for ", "while ", "try:", "except", "finally")
+
+# Leading whitespace of every line, stripped by reset_indentation in a single pass
+_RE_LEADING_WS = re.compile(r"^[^\S\n]+", re.MULTILINE)
+
+# Number of recent apply_indent results kept for repeated Apply/Reset cycles
+_FORMAT_CACHE_SIZE = 8
+
+# Indent prefixes keyed by (level, spaces), shared across apply_indent runs
+_INDENT_CACHE = {}
+
+def _indent(level, spaces):
+    """
+    Returns the whitespace prefix for the given indent level, building it only once.
+    """
+    prefix = _INDENT_CACHE.get((level, spaces))
+    if prefix is None:
+        prefix = _INDENT_CACHE[(level, spaces)] = sys.intern(' ' * (level * spaces))
+    return prefix
 
 class PythonReindenterApp:
     """
@@ -15,6 +40,9 @@ class PythonReindenterApp:
         self.filename = None
         self.indentation_applied = False
         self.version = "1.2"
+        self._buffer = ""  # Mirror of the text area contents, see _get_buffer
+        self._buffer_lines = [""]  # The same contents split on newlines, reused by display_code
+        self._format_cache = {}  # (code, spaces) -> indented code, oldest entry first
 
         # Setup Menu
         self.create_menu()
@@ -69,24 +97,70 @@ class PythonReindenterApp:
         """
         if self.filename and self.indentation_applied:
             with open(self.filename, 'w') as file:
-                file.write(self.text_display.get("1.0", tk.END).strip())
+                file.write(self._get_buffer().strip())
             messagebox.showinfo("Save", f"File saved as {self.filename}")
 
-    def display_code(self, code):
+    def _get_buffer(self):
+        """
+        Returns the code shown in the text area. The widget is read-only and only written by
+        display_code, so the cached copy is returned instead of marshalling it back out of Tk.
+        """
+        return self._buffer
+
+    @contextlib.contextmanager
+    def _editable(self):
         """
-        Displays code in the text area, making it read-only.
+        Temporarily makes the read-only text area writable.
         """
         self.text_display.config(state="normal")
-        self.text_display.delete("1.0", tk.END)
-        self.text_display.insert("1.0", code)
-        self.text_display.config(state="disabled")
+        try:
+            yield self.text_display
+        finally:
+            self.text_display.config(state="disabled")
+
+    def display_code(self, code):
+        """
+        Displays code in the text area, making it read-only. Only the lines that differ
+        from the current contents are replaced, so Tk does not re-layout the whole buffer.
+        """
+        if self._buffer == code:
+            return
+
+        old_lines = self._buffer_lines
+        new_lines = code.split("\n")
+
+        # Skip the lines shared at the start and end of both versions
+        common = min(len(old_lines), len(new_lines))
+        prefix = 0
+        while prefix < common and old_lines[prefix] == new_lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < common - prefix and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+            suffix += 1
+
+        changed = new_lines[prefix:len(new_lines) - suffix]
+        with self._editable() as text:
+            if suffix:
+                # Replace whole lines, each including its trailing newline
+                start, end = f"{prefix + 1}.0", f"{len(old_lines) - suffix + 1}.0"
+                replacement = "".join(line + "\n" for line in changed)
+            elif prefix:
+                # Replace everything after the end of the last unchanged line
+                start, end = f"{prefix}.end", "end-1c"
+                replacement = "".join("\n" + line for line in changed)
+            else:
+                start, end = "1.0", "end-1c"
+                replacement = code
+            text.replace(start, end, replacement)
+        self._buffer = code
+        self._buffer_lines = new_lines
 
     def reset_indentation(self):
         """
         Resets all indentation, removing any existing indents in the displayed code.
         """
-        code = self.text_display.get("1.0", tk.END).strip()
-        stripped_code = "\n".join(line.replace('\t', ' ' * 4).lstrip() for line in code.splitlines())
+        code = self._get_buffer().strip()
+        stripped_code = _RE_LEADING_WS.sub("", code.replace('\t', ' ' * 4))
         self.display_code(stripped_code)
         self.indentation_applied = False
         self.update_save_state()
@@ -95,7 +169,22 @@ class PythonReindenterApp:
         """
         Applies consistent indentation to the Python code, handling blocks and nested structures accurately.
         """
-        code = self.text_display.get("1.0", tk.END).strip()
+        code = self._get_buffer().strip()
+        key = (code, spaces)
+        formatted_code = self._format_cache.get(key)
+        if formatted_code is None:
+            formatted_code = self._indent_code(code, spaces)
+            if len(self._format_cache) >= _FORMAT_CACHE_SIZE:
+                del self._format_cache[next(iter(self._format_cache))]
+            self._format_cache[key] = formatted_code
+        self.display_code(formatted_code)
+        self.indentation_applied = True
+        self.update_save_state()
+
+    def _indent_code(self, code, spaces):
+        """
+        Returns code re-indented by block structure, using the given number of spaces per level.
+        """
         lines = code.splitlines()
         indented_lines = []
         indent_level = 0
@@ -112,40 +201,37 @@ class PythonReindenterApp:
             # Handle multiline constructs (e.g., docstrings) without increasing indent level
             if stripped_line.startswith(('"""', "'''")) and not inside_multiline_construct:
                 inside_multiline_construct = True
-                indented_lines.append(' ' * (indent_level * spaces) + stripped_line)
+                indented_lines.append(_indent(indent_level, spaces) + stripped_line)
                 continue
             elif stripped_line.endswith(('"""', "'''")) and inside_multiline_construct:
                 inside_multiline_construct = False
-                indented_lines.append(' ' * (indent_level * spaces) + stripped_line)
+                indented_lines.append(_indent(indent_level, spaces) + stripped_line)
                 continue
 
             if inside_multiline_construct:
-                indented_lines.append(' ' * (indent_level * spaces) + stripped_line)
+                indented_lines.append(_indent(indent_level, spaces) + stripped_line)
                 continue
 
             # Dedent for block closers that also act as new block openers (e.g., "elif", "else", "except", "finally")
-            if stripped_line.startswith(("elif", "else", "except", "finally")):
+            if stripped_line.startswith(_DEDENT_KW):
                 if indent_level > 0:
                     indent_level -= 1
-                indented_lines.append(' ' * (indent_level * spaces) + stripped_line)
+                indented_lines.append(_indent(indent_level, spaces) + stripped_line)
                 indent_level += 1  # Re-indent for the new block
                 continue
 
             # Reset indentation level for new definitions (e.g., def or class)
-            if re.match(r"^(def |class )", stripped_line):
+            if stripped_line.startswith(_DEFCLASS_KW):
                 indent_level = 0
 
             # Apply indentation for the current line
-            indented_lines.append(' ' * (indent_level * spaces) + stripped_line)
+            indented_lines.append(_indent(indent_level, spaces) + stripped_line)
 
             # Check if the current line is a block opener
-            if stripped_line.endswith(":") and re.match(r'^(def |class |if |for |while |try:|except|finally)', stripped_line):
+            if stripped_line.endswith(":") and stripped_line.startswith(_BLOCK_KW):
                 indent_level += 1
 
-        formatted_code = "\n".join(indented_lines)
-        self.display_code(formatted_code)
-        self.indentation_applied = True
-        self.update_save_state()
+        return "\n".join(indented_lines)
 
     def update_save_state(self):
         """